@@ -10,28 +10,92 @@ Designed to help new engineers quickly understand the environment without
 requiring deep prior knowledge of the system.
 
 Requirements:
-    - Python 3.6+
+    - Python 3.9+
     - requests library (install with: pip install requests)
+    - orjson library (optional, faster JSON parsing: pip install orjson)
+    - brotli library (optional, brotli-compressed responses: pip install brotli)
+    - httpx library (optional, for --http2: pip install 'httpx[http2]')
 
 Usage:
-    python cribl_explorer.py
+    python cribl_explorer.py [--groups ID1,ID2] [--kinds KIND1,KIND2]
+                             [--summary-only] [--max-workers N] [--no-cache]
+                             [--http2]
 
 Author: Andrew Hendrix + Opus 4.5  
 """
 
-import getpass
+import argparse
+import functools
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import re
 import sys
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from urllib.parse import urlencode, urlsplit
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 # ============================================================================
 # DEPENDENCY CHECK
 # ============================================================================
-try:
-    import requests
-except ImportError:
-    print("Error: The 'requests' library is required but not installed.")
-    print("Please install it using: pip install requests")
-    sys.exit(1)
+# Third-party modules are imported on first use so startup (and any early
+# exit) does not pay for them.
+
+def _require(module_name: str, package: Optional[str] = None):
+    """
+    Import a required third-party module, exiting with install help if missing.
+
+    Args:
+        module_name: The module to import (e.g., 'requests')
+        package: The pip package providing it (defaults to module_name)
+
+    Returns:
+        The imported module
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        package = package or module_name
+        print(f"Error: The '{package}' library is required but not installed.")
+        print(f"Please install it using: pip install {package}")
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_loader():
+    """Return the fastest available JSON parser (orjson is optional)."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse a JSON document from bytes."""
+    return _json_loader()(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_dumper():
+    """Return the fastest available JSON serializer (orjson is optional)."""
+    try:
+        import orjson
+        return orjson.dumps
+    except ImportError:
+        return lambda obj: json.dumps(obj).encode()
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to a JSON document in bytes."""
+    return _json_dumper()(obj)
 
 
 # ============================================================================
@@ -42,21 +106,277 @@ except ImportError:
 ENDPOINTS = {
     'groups': '/api/v1/master/groups',
     'workers': '/api/v1/master/workers',
-    'inputs': '/api/v1/m/{group_id}/system/inputs',
-    'outputs': '/api/v1/m/{group_id}/system/outputs',
-    'pipelines': '/api/v1/m/{group_id}/pipelines',  # Pipelines are NOT under /system/
-    'routes': '/api/v1/m/{group_id}/routes',
-    'packs': '/api/v1/m/{group_id}/packs',
+}
+
+# Per-group endpoint paths (appended to '/api/v1/m/{group_id}')
+GROUP_ENDPOINTS = {
+    'inputs': '/system/inputs',
+    'outputs': '/system/outputs',
+    'pipelines': '/pipelines',  # Pipelines are NOT under /system/
+    'routes': '/routes',
+    'packs': '/packs',
 }
 
 # HTTP timeout for API requests (in seconds)
 REQUEST_TIMEOUT = 30
 
+# Read size when downloading response bodies (in bytes)
+BODY_CHUNK_SIZE = 64 * 1024
+
+# HTTP timeout for establishing a connection (in seconds); kept short so an
+# unreachable host fails fast and is retried instead of stalling a worker
+CONNECT_TIMEOUT = 3.05
+
+# Default maximum number of concurrent API requests when fetching group details
+# (the client sizes its connection pool to match so every request reuses one)
+MAX_WORKERS = 32
+
+# Number of per-host connection pools kept by the shared HTTP session
+POOL_CONNECTIONS = 10
+
+# Rate limiting and transient server errors are retried automatically (with
+# backoff, honouring any Retry-After header)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5
+# Longest wait honoured for a Retry-After header (in seconds), so a server asking
+# for an hour cannot stall a request thread, or quitting, for that long
+MAX_RETRY_AFTER = 30
+# Read errors (including read timeouts) are retried only once, so an endpoint
+# that never answers costs two timeouts rather than six
+RETRY_READ = 1
+
+# In-memory reuse of successful responses (seconds), by the endpoint's last path
+# segment; worker status changes often while configuration is comparatively stable
+RESPONSE_TTL_DEFAULT = 60
+RESPONSE_TTLS = {
+    'workers': 30,
+    'pipelines': 300,
+    'routes': 300,
+    'packs': 300,
+}
+RESPONSE_CACHE_SIZE = 512
+
+# How long a saved snapshot of all fetched data is used on startup (seconds)
+DATA_SNAPSHOT_TTL = 300
+
+# Background refresh: wait this long after loading before refetching quietly,
+# and only use the prefetched data for "Refresh Data" while it is this fresh
+PREFETCH_DELAY = 30
+PREFETCH_MAX_AGE = 60
+
+# Token format check, run before any request is made: URL-safe characters (JWTs)
+_TOKEN_RE = re.compile(r'^[A-Za-z0-9._\-]{20,}$')
+
+# Directory for cached API responses (revalidated with ETags on every run)
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'cribl_explorer'
+)
+
+
+# ============================================================================
+# RESPONSE CACHE CLASSES
+# ============================================================================
+
+class TTLCache:
+    """
+    A thread-safe in-memory cache whose entries expire after a per-entry TTL.
+
+    When full, the least recently used entry is evicted first.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store a value that expires after ttl seconds."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """
+    An on-disk cache of raw API responses keyed by account and request URL.
+
+    Each entry stores the response body alongside its ETag and Last-Modified
+    validators so later runs can send a conditional request and reuse the
+    cached body on '304 Not Modified'.
+    Responses may contain sensitive configuration, so the cache directory and
+    files are only readable by the current user. Cache failures are never
+    fatal; the request simply falls back to a full fetch.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, account_key: str = ''):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored
+            account_key: Identifies the account the responses belong to, so
+                         one account never revalidates (or reuses) another's
+                         cached responses
+        """
+        self.cache_dir = cache_dir
+        self.account_key = account_key
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        """Return the (body, metadata) file paths for a URL."""
+        key = hashlib.sha1(f"{self.account_key}\n{url}".encode()).hexdigest()
+        return (os.path.join(self.cache_dir, f"{key}.json"),
+                os.path.join(self.cache_dir, f"{key}.meta"))
+
+    def load(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """
+        Load a cached response.
+
+        Args:
+            url: The full request URL
+
+        Returns:
+            Tuple of (etag, last modified, raw body) or None if nothing usable is cached
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        etag = meta.get('etag')
+        last_modified = meta.get('last_modified')
+        if not (etag or last_modified) or meta.get('url') != url:
+            return None
+        return etag, last_modified, body
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: The full request URL
+            etag: The ETag header returned with the response
+            last_modified: The Last-Modified header returned with the response
+            body: The raw response body
+        """
+        body_path, meta_path = self._paths(url)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'fetched_at': time.time()}
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+        except OSError:
+            pass  # Caching is best-effort
+
+    def _snapshot_path(self, key: str) -> str:
+        """Return the file path of a data snapshot."""
+        return os.path.join(self.cache_dir, f"{key}.snapshot.json")
+
+    def load_snapshot(self, key: str, max_age: float) -> Optional[Tuple[float, Dict]]:
+        """
+        Load a snapshot of aggregated data if it is recent enough.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+            max_age: Maximum snapshot age in seconds
+
+        Returns:
+            Tuple of (age in seconds, data) or None if missing, stale or invalid
+        """
+        path = self._snapshot_path(key)
+        try:
+            age = time.time() - os.stat(path).st_mtime
+            if age >= max_age:
+                return None
+            with open(path, 'rb') as f:
+                return age, json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def store_snapshot(self, key: str, data: Dict):
+        """
+        Store a snapshot of aggregated data.
+
+        Args:
+            key: Snapshot key (see snapshot_key)
+            data: JSON-serializable data dictionary
+        """
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            self._write_atomic(self._snapshot_path(key), json_dumps(data))
+        except (OSError, TypeError):
+            pass  # Caching is best-effort
+
+    def _write_atomic(self, path: str, content: bytes):
+        """Write a file via a private temp file and rename it into place."""
+        import tempfile
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)  # Created with mode 0600
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
 
 # ============================================================================
 # API CLIENT CLASS
 # ============================================================================
 
+class APIError(str):
+    """
+    Error message returned by CriblAPIClient in place of a response.
+
+    It is a plain string for display, and also records whether the failure
+    is temporary (network errors, rate limiting, server errors) so callers
+    can retry with the same credentials instead of asking for new ones.
+    """
+
+    def __new__(cls, message: str, status_code: Optional[int] = None, transient: bool = False):
+        error = super().__new__(cls, message)
+        error.status_code = status_code
+        error.transient = transient
+        return error
+
+    def with_context(self, prefix: str) -> 'APIError':
+        """Return the same error with a prefix describing what failed."""
+        return APIError(f"{prefix}{self}", self.status_code, self.transient)
+
+
 class CriblAPIClient:
     """
     A client for interacting with the Cribl Cloud API.
@@ -65,7 +385,8 @@ class CriblAPIClient:
     API interactions with the Cribl Cloud instance.
     """
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, cache_dir: Optional[str] = CACHE_DIR,
+                 max_workers: int = MAX_WORKERS, http2: bool = False):
         """
         Initialize the API client.
 
@@ -73,18 +394,148 @@ class CriblAPIClient:
             base_url: The Cribl Cloud instance base URL
                       (e.g., 'https://main-instance.cribl.cloud')
             token: The Bearer authentication token for API access
+            cache_dir: Directory for the on-disk response cache (None disables it)
+            max_workers: Maximum number of concurrent requests (also the pool size)
+            http2: Send requests over HTTP/2 with httpx instead of requests
         """
         # Remove trailing slash from base URL if present
         self.base_url = base_url.rstrip('/')
         self.token = token
+        # Identifies the account (instance and token) in cache keys. The full
+        # token is hashed (never stored): a prefix is not enough because JWTs
+        # all begin with the same encoded header.
+        self.account_key = hashlib.sha256(f"{self.base_url}\n{token}".encode()).hexdigest()[:16]
+        self.cache = ResponseCache(cache_dir, self.account_key) if cache_dir else None
+        self.recent = TTLCache()
+        # Validators and bodies for conditional requests when there is no disk cache
+        self._validated: Dict[str, Tuple[Optional[str], Optional[str], bytes]] = {}
+        self.max_workers = max_workers
+        self.http2 = http2
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._closed = False
 
         # Set up default headers for all requests
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
         }
 
+        if http2:
+            self.session = self._create_http2_session()
+        else:
+            self.session = self._create_http1_session()
+
+    def _create_http1_session(self):
+        """Create the requests session used for HTTP/1.1 keep-alive connections."""
+        requests = _require('requests')
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+
+        # Advertise every compression the installed decoders support
+        # (includes 'br' when the optional brotli package is installed)
+        self.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+        # Reuse a single session so keep-alive connections (and their TLS
+        # handshakes) are shared across every API call
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        class CappedRetry(Retry):
+            """Retry that waits at most MAX_RETRY_AFTER for a Retry-After header."""
+
+            def get_retry_after(self, response):
+                retry_after = super().get_retry_after(response)
+                return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+        # Transient failures are retried with exponential backoff; once retries
+        # are exhausted the last response is returned and reported normally
+        retry = CappedRetry(
+            total=RETRY_TOTAL,
+            read=RETRY_READ,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # pool_block makes the pool a hard cap: extra threads wait for a warm
+        # connection instead of opening (and discarding) one-off connections
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=self.max_workers,
+            max_retries=retry,
+            pool_block=True,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _create_http2_session(self):
+        """
+        Create the httpx client used for HTTP/2.
+
+        Every concurrent request is multiplexed as a stream over one HTTP/2
+        connection, so a full fetch costs a single TLS handshake. httpx picks
+        its own Accept-Encoding from the decoders it has available.
+        """
+        httpx = _require('httpx', 'httpx[http2]')
+        _require('h2', 'httpx[http2]')
+
+        return httpx.Client(
+            http2=True,
+            headers=self.headers,
+            # Follow redirects (e.g. http -> https) like the requests transport does
+            follow_redirects=True,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+            # Servers without HTTP/2 fall back to one HTTP/1.1 connection per worker
+            limits=httpx.Limits(max_connections=self.max_workers),
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool for concurrent requests, created on first use.
+
+        The pool lives as long as the client so refreshes reuse its threads
+        just as they reuse the session's connections.
+        """
+        with self._executor_lock:
+            if self._closed:
+                raise RuntimeError("The API client has been closed.")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='cribl-api'
+                )
+            return self._executor
+
+    def invalidate(self):
+        """Forget recently fetched responses so the next calls hit the API."""
+        self.recent.clear()
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+
+        Queued requests (e.g. from a background refresh) are cancelled rather
+        than sent, and the thread pool cannot be recreated afterwards.
+        """
+        with self._executor_lock:
+            self._closed = True
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Tuple[bool, Any]:
         """
         Make an authenticated GET request to the Cribl API.
@@ -94,43 +545,203 @@ class CriblAPIClient:
             params: Optional query parameters for the request
 
         Returns:
-            Tuple of (success: bool, data: dict or error message: str)
+            Tuple of (success: bool, data: dict or APIError)
+        """
+        success, result = self._make_raw_request(endpoint, params)
+        if not success:
+            return False, result
+
+        # Parse JSON response directly from bytes
+        try:
+            return True, json_loads(result[1])
+        except ValueError as e:
+            return False, APIError(f"Invalid JSON response: {str(e)}")
+
+    def _make_raw_request(self, endpoint: str, params: Optional[Dict] = None) -> Tuple[bool, Any]:
+        """
+        Make an authenticated GET request and return the unparsed response body.
+
+        The first element of a successful result is the response version: its
+        ETag, or its Last-Modified date when the server sends no ETag. It is
+        None when the response cannot be revalidated.
+
+        Args:
+            endpoint: The API endpoint path (will be appended to base URL)
+            params: Optional query parameters for the request
+
+        Returns:
+            Tuple of (success, (version or None, raw body bytes) or APIError)
         """
         url = f"{self.base_url}{endpoint}"
+        cache_url = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+        # Reuse a response fetched within its TTL without contacting the API
+        recent = self.recent.get(cache_url)
+        if recent is not None:
+            return True, recent
+
+        # Otherwise revalidate any cached copy instead of downloading it again
+        cached = self.cache.load(cache_url) if self.cache else self._validated.get(cache_url)
+        request_headers = {}
+        if cached:
+            if cached[0]:
+                request_headers['If-None-Match'] = cached[0]
+            if cached[1]:
+                request_headers['If-Modified-Since'] = cached[1]
+
+        get = self._get_http2 if self.http2 else self._get_http1
+        success, result = get(url, params, request_headers or None)
+        if not success:
+            return False, result
+        status_code, response_headers, body = result
+
+        # Check for HTTP errors
+        if status_code == 304 and cached:
+            etag, last_modified, body = cached
+        elif status_code >= 400:
+            return False, APIError(self._http_error_message(status_code, endpoint), status_code,
+                                   transient=status_code in RETRY_STATUS_CODES)
+        elif status_code != 200:
+            return False, APIError(f"Unexpected status code: {status_code}", status_code)
+        else:
+            # Cache fresh responses that can be revalidated later
+            etag = response_headers.get('ETag')
+            last_modified = response_headers.get('Last-Modified')
+            if etag or last_modified:
+                if self.cache:
+                    self.cache.store(cache_url, etag, last_modified, body)
+                else:
+                    self._validated[cache_url] = (etag, last_modified, body)
+
+        version = etag or last_modified
+        ttl = RESPONSE_TTLS.get(endpoint.rsplit('/', 1)[-1], RESPONSE_TTL_DEFAULT)
+        self.recent.set(cache_url, (version, body), ttl)
+
+        return True, (version, body)
+
+    def _get_http1(self, url: str, params: Optional[Dict],
+                   headers: Optional[Dict]) -> Tuple[bool, Any]:
+        """
+        Send a GET request over the requests session.
+
+        Args:
+            url: The full request URL
+            params: Optional query parameters for the request
+            headers: Optional extra request headers
+
+        Returns:
+            Tuple of (success, (status code, response headers, body or None) or APIError);
+            the body is only downloaded for '200 OK' responses
+        """
+        import requests
 
         try:
-            response = requests.get(
+            # Stream the response so error bodies are never downloaded and
+            # large bodies are read in big chunks (the connection is released
+            # back to the pool when the block exits)
+            with self.session.get(
                 url,
-                headers=self.headers,
                 params=params,
-                timeout=REQUEST_TIMEOUT
-            )
-
-            # Check for HTTP errors
-            if response.status_code == 401:
-                return False, "Authentication failed. Please check your Bearer token."
-            elif response.status_code == 403:
-                return False, "Access forbidden. Your token may lack required permissions."
-            elif response.status_code == 404:
-                return False, f"Endpoint not found: {endpoint}. Check your base URL."
-            elif response.status_code >= 500:
-                return False, f"Server error ({response.status_code}). Try again later."
-            elif response.status_code != 200:
-                return False, f"Unexpected status code: {response.status_code}"
-
-            # Parse JSON response
-            try:
-                data = response.json()
-                return True, data
-            except ValueError as e:
-                return False, f"Invalid JSON response: {str(e)}"
+                headers=headers,
+                timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT),
+                stream=True
+            ) as response:
+                body = None
+                if response.status_code == 200:
+                    body = b''.join(response.iter_content(chunk_size=BODY_CHUNK_SIZE))
+                return True, (response.status_code, response.headers, body)
 
         except requests.exceptions.ConnectionError:
-            return False, "Connection failed. Check your URL and network connection."
+            return False, APIError("Connection failed. Check your URL and network connection.",
+                                   transient=True)
         except requests.exceptions.Timeout:
-            return False, f"Request timed out after {REQUEST_TIMEOUT} seconds."
+            return False, APIError(f"Request timed out after {REQUEST_TIMEOUT} seconds.",
+                                   transient=True)
         except requests.exceptions.RequestException as e:
-            return False, f"Request error: {str(e)}"
+            return False, APIError(f"Request error: {str(e)}")
+
+    def _get_http2(self, url: str, params: Optional[Dict],
+                   headers: Optional[Dict]) -> Tuple[bool, Any]:
+        """
+        Send a GET request over the httpx HTTP/2 client.
+
+        httpx has no equivalent of urllib3's Retry, so transient failures are
+        retried here with the same limits and backoff.
+
+        Args:
+            url: The full request URL
+            params: Optional query parameters for the request
+            headers: Optional extra request headers
+
+        Returns:
+            Tuple of (success, (status code, response headers, body or None) or APIError);
+            the body is only downloaded for '200 OK' responses
+        """
+        import httpx
+
+        read_retries = RETRY_READ
+        for attempt in range(RETRY_TOTAL + 1):
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            try:
+                with self.session.stream('GET', url, params=params, headers=headers) as response:
+                    if response.status_code in RETRY_STATUS_CODES and attempt < RETRY_TOTAL:
+                        retry_after = response.headers.get('Retry-After', '')
+                        if retry_after.isdigit():
+                            delay = min(int(retry_after), MAX_RETRY_AFTER)
+                    else:
+                        body = None
+                        if response.status_code == 200:
+                            body = b''.join(response.iter_bytes(chunk_size=BODY_CHUNK_SIZE))
+                        return True, (response.status_code, response.headers, body)
+
+            except httpx.TransportError as e:
+                retryable = not isinstance(e, httpx.UnsupportedProtocol)
+                if isinstance(e, (httpx.ReadError, httpx.ReadTimeout)):
+                    retryable = read_retries > 0
+                    read_retries -= 1
+                if attempt < RETRY_TOTAL and retryable:
+                    time.sleep(delay)
+                    continue
+                if isinstance(e, httpx.ConnectError):
+                    return False, APIError("Connection failed. Check your URL and network connection.",
+                                           transient=True)
+                if isinstance(e, httpx.TimeoutException):
+                    return False, APIError(f"Request timed out after {REQUEST_TIMEOUT} seconds.",
+                                           transient=True)
+                return False, APIError(f"Request error: {str(e)}")
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                return False, APIError(f"Request error: {str(e)}")
+
+            time.sleep(delay)
+
+    @staticmethod
+    def _http_error_message(status_code: int, endpoint: str) -> str:
+        """
+        Describe an HTTP error status in user-friendly terms.
+
+        Args:
+            status_code: The HTTP status code of the failed response
+            endpoint: The API endpoint path that was requested
+
+        Returns:
+            Error message suitable for display
+        """
+        if status_code == 401:
+            return "Authentication failed. Please check your Bearer token."
+        if status_code == 403:
+            return "Access forbidden. Your token may lack required permissions."
+        if status_code == 404:
+            return f"Endpoint not found: {endpoint}. Check your base URL."
+        if status_code == 429:
+            return "Rate limited by the API. Try again later."
+        if status_code >= 500:
+            return f"Server error ({status_code}). Try again later."
+        return f"Unexpected status code: {status_code}"
+
+    @staticmethod
+    def _group_endpoint(group_id: str, component: str) -> str:
+        """Build the endpoint path for one component of a worker group."""
+        return f"/api/v1/m/{group_id}{GROUP_ENDPOINTS[component]}"
 
     def get_groups(self) -> Tuple[bool, Any]:
         """
@@ -160,8 +771,7 @@ class CriblAPIClient:
         Returns:
             Tuple of (success, list of inputs or error message)
         """
-        endpoint = ENDPOINTS['inputs'].format(group_id=group_id)
-        return self._make_request(endpoint)
+        return self._make_request(self._group_endpoint(group_id, 'inputs'))
 
     def get_outputs(self, group_id: str) -> Tuple[bool, Any]:
         """
@@ -173,8 +783,7 @@ class CriblAPIClient:
         Returns:
             Tuple of (success, list of outputs or error message)
         """
-        endpoint = ENDPOINTS['outputs'].format(group_id=group_id)
-        return self._make_request(endpoint)
+        return self._make_request(self._group_endpoint(group_id, 'outputs'))
 
     def get_pipelines(self, group_id: str) -> Tuple[bool, Any]:
         """
@@ -186,8 +795,7 @@ class CriblAPIClient:
         Returns:
             Tuple of (success, list of pipelines or error message)
         """
-        endpoint = ENDPOINTS['pipelines'].format(group_id=group_id)
-        return self._make_request(endpoint)
+        return self._make_request(self._group_endpoint(group_id, 'pipelines'))
 
     def get_routes(self, group_id: str) -> Tuple[bool, Any]:
         """
@@ -199,8 +807,20 @@ class CriblAPIClient:
         Returns:
             Tuple of (success, list of routes or error message)
         """
-        endpoint = ENDPOINTS['routes'].format(group_id=group_id)
-        return self._make_request(endpoint)
+        return self._make_request(self._group_endpoint(group_id, 'routes'))
+
+    def get_group_component_raw(self, component: str, group_id: str) -> Tuple[bool, Any]:
+        """
+        Retrieve the unparsed response for one component of a worker group.
+
+        Args:
+            component: The component key in GROUP_ENDPOINTS (e.g., 'inputs', 'routes')
+            group_id: The ID of the worker group
+
+        Returns:
+            Tuple of (success, (version, raw body) or error message)
+        """
+        return self._make_raw_request(self._group_endpoint(group_id, component))
 
     def get_packs(self, group_id: str) -> Tuple[bool, Any]:
         """
@@ -212,14 +832,17 @@ class CriblAPIClient:
         Returns:
             Tuple of (success, list of packs or error message)
         """
-        endpoint = ENDPOINTS['packs'].format(group_id=group_id)
-        return self._make_request(endpoint)
+        return self._make_request(self._group_endpoint(group_id, 'packs'))
 
 
 # ============================================================================
 # DATA EXTRACTION FUNCTIONS
 # ============================================================================
 
+# Shared read-only default for missing nested objects (avoids a new {} per lookup)
+_EMPTY = MappingProxyType({})
+
+
 def extract_group_info(groups_data: Dict) -> List[Dict]:
     """
     Extract relevant information from the groups API response.
@@ -230,20 +853,17 @@ def extract_group_info(groups_data: Dict) -> List[Dict]:
     Returns:
         List of dictionaries with extracted group details
     """
-    items = groups_data.get('items', [])
-    extracted = []
-
-    for group in items:
-        extracted.append({
+    return [
+        {
             'id': group.get('id', 'N/A'),
             'name': group.get('name', group.get('id', 'N/A')),
             'product': group.get('product', 'stream'),
             'description': group.get('description', ''),
             'worker_count': group.get('workerCount', 0),
             'configVersion': group.get('configVersion', 'N/A'),
-        })
-
-    return extracted
+        }
+        for group in groups_data.get('items', [])
+    ]
 
 
 def extract_worker_info(workers_data: Dict) -> List[Dict]:
@@ -260,8 +880,10 @@ def extract_worker_info(workers_data: Dict) -> List[Dict]:
     extracted = []
 
     for worker in items:
-        # Get worker info from nested structure if present
-        info = worker.get('info', {})
+        # Get worker info from nested structure if present (looked up once)
+        info = worker.get('info') or _EMPTY
+        cribl = info.get('cribl') or _EMPTY
+        host = info.get('host') or _EMPTY
 
         # Determine worker status - check multiple possible field names
         # The API uses 'disconnected' (false = connected) and 'status' (healthy = online)
@@ -286,7 +908,7 @@ def extract_worker_info(workers_data: Dict) -> List[Dict]:
             is_online = True
 
         # Determine worker type (Stream vs Edge)
-        dist_mode = info.get('cribl', {}).get('distMode', 'worker')
+        dist_mode = cribl.get('distMode', 'worker')
         if 'edge' in dist_mode.lower():
             worker_type = 'Edge'
         else:
@@ -297,8 +919,8 @@ def extract_worker_info(workers_data: Dict) -> List[Dict]:
             'hostname': info.get('hostname', worker.get('hostname', 'N/A')),
             'group': worker.get('group', 'N/A'),
             'status': 'Online' if is_online else 'Offline',
-            'version': info.get('cribl', {}).get('version', 'N/A'),
-            'ip': info.get('host', {}).get('ip', 'N/A'),
+            'version': cribl.get('version', 'N/A'),
+            'ip': host.get('ip', 'N/A'),
             'type': worker_type,
         })
 
@@ -315,19 +937,16 @@ def extract_input_info(inputs_data: Dict) -> List[Dict]:
     Returns:
         List of dictionaries with extracted input details
     """
-    items = inputs_data.get('items', [])
-    extracted = []
-
-    for inp in items:
-        extracted.append({
+    return [
+        {
             'id': inp.get('id', 'N/A'),
             'type': inp.get('type', 'N/A'),
             'disabled': inp.get('disabled', False),
-            'port': inp.get('port', inp.get('host', 'N/A')),
+            'port': inp['port'] if 'port' in inp else inp.get('host', 'N/A'),
             'description': inp.get('description', ''),
-        })
-
-    return extracted
+        }
+        for inp in inputs_data.get('items', [])
+    ]
 
 
 def extract_output_info(outputs_data: Dict) -> List[Dict]:
@@ -340,19 +959,16 @@ def extract_output_info(outputs_data: Dict) -> List[Dict]:
     Returns:
         List of dictionaries with extracted output details
     """
-    items = outputs_data.get('items', [])
-    extracted = []
-
-    for out in items:
-        extracted.append({
+    return [
+        {
             'id': out.get('id', 'N/A'),
             'type': out.get('type', 'N/A'),
             'disabled': out.get('disabled', False),
             'description': out.get('description', ''),
             'pipeline': out.get('pipeline', ''),
-        })
-
-    return extracted
+        }
+        for out in outputs_data.get('items', [])
+    ]
 
 
 def extract_pipeline_info(pipelines_data: Dict) -> List[Dict]:
@@ -369,16 +985,17 @@ def extract_pipeline_info(pipelines_data: Dict) -> List[Dict]:
     extracted = []
 
     for pipe in items:
-        # Count the number of functions in the pipeline
-        functions = pipe.get('conf', {}).get('functions', [])
-        function_types = [f.get('id', 'unknown') for f in functions]
+        conf = pipe.get('conf') or _EMPTY
+
+        # Count the number of functions in the pipeline, only naming the first 5
+        functions = conf.get('functions') or ()
 
         extracted.append({
             'id': pipe.get('id', 'N/A'),
-            'description': pipe.get('conf', {}).get('description', ''),
+            'description': conf.get('description', ''),
             'function_count': len(functions),
-            'functions': function_types[:5],  # Show first 5 functions
-            'disabled': pipe.get('conf', {}).get('disabled', False),
+            'functions': [f.get('id', 'unknown') for f in functions[:5]],
+            'disabled': conf.get('disabled', False),
         })
 
     return extracted
@@ -396,26 +1013,21 @@ def extract_route_info(routes_data: Dict) -> List[Dict]:
     Returns:
         List of dictionaries with extracted route details
     """
-    items = routes_data.get('items', [])
-    extracted = []
-
-    for route in items:
-        # Routes contain a list of route entries
-        routes_list = route.get('routes', [])
-
-        for r in routes_list:
-            extracted.append({
-                'id': r.get('id', r.get('name', 'N/A')),
-                'name': r.get('name', 'N/A'),
-                'filter': r.get('filter', '*'),
-                'pipeline': r.get('pipeline', 'passthru'),
-                'output': r.get('output', 'default'),
-                'enabled': not r.get('disabled', False),
-                'final': r.get('final', False),
-                'description': r.get('description', ''),
-            })
-
-    return extracted
+    # Each route table contains a list of route entries
+    return [
+        {
+            'id': r.get('id', r.get('name', 'N/A')),
+            'name': r.get('name', 'N/A'),
+            'filter': r.get('filter', '*'),
+            'pipeline': r.get('pipeline', 'passthru'),
+            'output': r.get('output', 'default'),
+            'enabled': not r.get('disabled', False),
+            'final': r.get('final', False),
+            'description': r.get('description', ''),
+        }
+        for route in routes_data.get('items', [])
+        for r in route.get('routes', [])
+    ]
 
 
 def extract_pack_info(packs_data: Dict) -> List[Dict]:
@@ -431,11 +1043,8 @@ def extract_pack_info(packs_data: Dict) -> List[Dict]:
     Returns:
         List of dictionaries with extracted pack details
     """
-    items = packs_data.get('items', [])
-    extracted = []
-
-    for pack in items:
-        extracted.append({
+    return [
+        {
             'id': pack.get('id', 'N/A'),
             'name': pack.get('displayName', pack.get('id', 'N/A')),
             'version': pack.get('version', 'N/A'),
@@ -443,8 +1052,42 @@ def extract_pack_info(packs_data: Dict) -> List[Dict]:
             'description': pack.get('description', ''),
             'disabled': pack.get('disabled', False),
             'source': pack.get('source', 'local'),
-        })
+        }
+        for pack in packs_data.get('items', [])
+    ]
+
+
+# Extracted components keyed by (account key, component, group ID), reused for
+# as long as the response version (ETag or Last-Modified) is unchanged
+_extraction_cache: Dict[Tuple[str, str, str], Tuple[str, List[Dict]]] = {}
+
 
+def extract_and_cache(cache_key: Tuple[str, str, str], version: Optional[str],
+                      body: bytes, extract) -> List[Dict]:
+    """
+    Parse and extract a raw API response, reusing the previous result when
+    the response version has not changed.
+
+    Args:
+        cache_key: Key identifying the account and endpoint the response came from
+        version: The response ETag or Last-Modified date (None disables caching)
+        body: The raw JSON response body
+        extract: The extract_* function to apply to the parsed response
+
+    Returns:
+        List of dictionaries with extracted details (empty if the body is invalid)
+    """
+    cached = _extraction_cache.get(cache_key)
+    if version and cached and cached[0] == version:
+        return cached[1]
+
+    try:
+        extracted = extract(json_loads(body))
+    except ValueError:
+        return []
+
+    if version:
+        _extraction_cache[cache_key] = (version, extracted)
     return extracted
 
 
@@ -452,52 +1095,76 @@ def extract_pack_info(packs_data: Dict) -> List[Dict]:
 # DISPLAY FUNCTIONS
 # ============================================================================
 
+def format_header(title: str, char: str = '=') -> List[str]:
+    """Return the lines of a formatted section header."""
+    width = 70
+    return ['', char * width, f" {title}", char * width]
+
+
 def print_header(title: str, char: str = '='):
     """Print a formatted section header."""
-    width = 70
-    print(f"\n{char * width}")
-    print(f" {title}")
-    print(f"{char * width}")
+    write_lines(format_header(title, char))
+
+
+def format_subheader(title: str) -> List[str]:
+    """Return the lines of a formatted subsection header."""
+    return ['', f"  --- {title} ---"]
 
 
 def print_subheader(title: str):
     """Print a formatted subsection header."""
-    print(f"\n  --- {title} ---")
+    write_lines(format_subheader(title))
 
 
-def print_table(headers: List[str], rows: List[List[str]], indent: int = 4):
+def format_table(headers: List[str], rows: List[List[str]], indent: int = 4) -> List[str]:
     """
-    Print a simple text-based table.
+    Format a simple text-based table.
 
     Args:
         headers: List of column headers
         rows: List of rows (each row is a list of values)
         indent: Number of spaces to indent the table
+
+    Returns:
+        List of output lines (without trailing newlines)
     """
     if not rows:
-        print(f"{' ' * indent}No data available.")
-        return
+        return [f"{' ' * indent}No data available."]
 
-    # Calculate column widths
+    # Convert cells to strings once, padding short rows with blank cells and
+    # dropping any cells beyond the headers, then calculate column widths
+    width = len(headers)
+    rows = [([str(cell) for cell in row] + [''] * width)[:width] for row in rows]
     col_widths = [len(h) for h in headers]
     for row in rows:
         for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+            col_widths[i] = max(col_widths[i], len(cell))
 
-    # Create format string
+    # Create format string once for the header and every row
     indent_str = ' ' * indent
+    row_format = indent_str + ' | '.join(f'{{:<{w}}}' for w in col_widths)
     separator = '-+-'.join('-' * w for w in col_widths)
 
-    # Print header
-    header_str = ' | '.join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    print(f"{indent_str}{header_str}")
-    print(f"{indent_str}{separator}")
+    lines = [row_format.format(*headers), f"{indent_str}{separator}"]
+    lines.extend(row_format.format(*row) for row in rows)
+    return lines
 
-    # Print rows
-    for row in rows:
-        row_str = ' | '.join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-        print(f"{indent_str}{row_str}")
+
+def print_table(headers: List[str], rows: List[List[str]], indent: int = 4):
+    """
+    Print a simple text-based table.
+
+    Args:
+        headers: List of column headers
+        rows: List of rows (each row is a list of values)
+        indent: Number of spaces to indent the table
+    """
+    write_lines(format_table(headers, rows, indent))
+
+
+def write_lines(lines: List[str]):
+    """Write a buffer of output lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def display_groups(groups: List[Dict]):
@@ -523,12 +1190,9 @@ def display_workers(workers: List[Dict], groups: List[Dict]):
     print_header("WORKERS")
 
     # Organize workers by group
-    workers_by_group: Dict[str, List[Dict]] = {}
+    workers_by_group: Dict[str, List[Dict]] = defaultdict(list)
     for worker in workers:
-        group_id = worker['group']
-        if group_id not in workers_by_group:
-            workers_by_group[group_id] = []
-        workers_by_group[group_id].append(worker)
+        workers_by_group[worker['group']].append(worker)
 
     # Display workers under each group
     for group in groups:
@@ -548,11 +1212,33 @@ def display_workers(workers: List[Dict], groups: List[Dict]):
             print("      No workers in this group.")
 
 
-def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
-                         pipelines: List[Dict], routes: List[Dict], packs: List[Dict] = None):
+def section_title(name: str, items: Optional[List[Dict]]) -> str:
+    """
+    Title a component section with its item count.
+
+    Args:
+        name: Section name
+        items: The section's items, or None if they were not fetched
+
+    Returns:
+        Title such as "Routes (4 total)" or "Routes (not fetched)"
+    """
+    return f"{name} (not fetched)" if items is None else f"{name} ({len(items)} total)"
+
+
+# Shown in place of a component that was skipped with --kinds or --summary-only
+NOT_FETCHED_NOTE = "      Not fetched (see --kinds / --summary-only)."
+
+
+def display_group_details(group: Dict, inputs: Optional[List[Dict]], outputs: Optional[List[Dict]],
+                         pipelines: Optional[List[Dict]], routes: Optional[List[Dict]],
+                         packs: Optional[List[Dict]] = None):
     """
     Display detailed information for a single worker group.
 
+    Components that were not fetched are passed as None and shown as such,
+    rather than as empty.
+
     Args:
         group: Group information dictionary
         inputs: List of inputs (sources) for the group
@@ -561,13 +1247,14 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
         routes: List of routes for the group
         packs: List of packs for the group
     """
-    if packs is None:
-        packs = []
-    print_header(f"GROUP DETAILS: {group['name']}", char='-')
+    # Collect the whole report in one buffer and write it at once
+    lines = format_header(f"GROUP DETAILS: {group['name']}", char='-')
 
     # Display Sources (Inputs)
-    print_subheader(f"Sources/Inputs ({len(inputs)} total)")
-    if inputs:
+    lines.extend(format_subheader(section_title("Sources/Inputs", inputs)))
+    if inputs is None:
+        lines.append(NOT_FETCHED_NOTE)
+    elif inputs:
         headers = ['ID', 'Type', 'Status', 'Port/Host']
         rows = [
             [
@@ -578,13 +1265,15 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
             ]
             for i in inputs
         ]
-        print_table(headers, rows, indent=6)
+        lines.extend(format_table(headers, rows, indent=6))
     else:
-        print("      No sources configured.")
+        lines.append("      No sources configured.")
 
     # Display Destinations (Outputs)
-    print_subheader(f"Destinations/Outputs ({len(outputs)} total)")
-    if outputs:
+    lines.extend(format_subheader(section_title("Destinations/Outputs", outputs)))
+    if outputs is None:
+        lines.append(NOT_FETCHED_NOTE)
+    elif outputs:
         headers = ['ID', 'Type', 'Status']
         rows = [
             [
@@ -594,13 +1283,15 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
             ]
             for o in outputs
         ]
-        print_table(headers, rows, indent=6)
+        lines.extend(format_table(headers, rows, indent=6))
     else:
-        print("      No destinations configured.")
+        lines.append("      No destinations configured.")
 
     # Display Pipelines
-    print_subheader(f"Pipelines ({len(pipelines)} total)")
-    if pipelines:
+    lines.extend(format_subheader(section_title("Pipelines", pipelines)))
+    if pipelines is None:
+        lines.append(NOT_FETCHED_NOTE)
+    elif pipelines:
         headers = ['ID', 'Functions', 'Status']
         rows = [
             [
@@ -610,13 +1301,15 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
             ]
             for p in pipelines
         ]
-        print_table(headers, rows, indent=6)
+        lines.extend(format_table(headers, rows, indent=6))
     else:
-        print("      No pipelines configured.")
+        lines.append("      No pipelines configured.")
 
     # Display Routes
-    print_subheader(f"Routes ({len(routes)} total)")
-    if routes:
+    lines.extend(format_subheader(section_title("Routes", routes)))
+    if routes is None:
+        lines.append(NOT_FETCHED_NOTE)
+    elif routes:
         headers = ['Name', 'Filter', 'Pipeline', 'Output', 'Final']
         rows = [
             [
@@ -628,13 +1321,15 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
             ]
             for r in routes
         ]
-        print_table(headers, rows, indent=6)
+        lines.extend(format_table(headers, rows, indent=6))
     else:
-        print("      No routes configured.")
+        lines.append("      No routes configured.")
 
     # Display Packs
-    print_subheader(f"Packs ({len(packs)} total)")
-    if packs:
+    lines.extend(format_subheader(section_title("Packs", packs)))
+    if packs is None:
+        lines.append(NOT_FETCHED_NOTE)
+    elif packs:
         headers = ['ID', 'Name', 'Version', 'Author', 'Status']
         rows = [
             [
@@ -646,31 +1341,37 @@ def display_group_details(group: Dict, inputs: List[Dict], outputs: List[Dict],
             ]
             for p in packs
         ]
-        print_table(headers, rows, indent=6)
+        lines.extend(format_table(headers, rows, indent=6))
     else:
-        print("      No packs installed.")
+        lines.append("      No packs installed.")
+
+    write_lines(lines)
 
 
-def display_data_flow_diagram(group: Dict, inputs: List[Dict], outputs: List[Dict],
-                              pipelines: List[Dict], routes: List[Dict]):
+def display_data_flow_diagram(group: Dict, inputs: Optional[List[Dict]], outputs: Optional[List[Dict]],
+                              pipelines: Optional[List[Dict]], routes: Optional[List[Dict]]):
     """
     Display an ASCII art diagram showing the data flow for a group.
 
     This visualization helps understand how data moves from sources
-    through pipelines to destinations.
+    through pipelines to destinations. Components that were not fetched are
+    passed as None and shown as '-'.
     """
     print_subheader("Data Flow Visualization")
 
     # Get active (enabled) components
-    active_inputs = [i for i in inputs if not i['disabled']]
-    active_outputs = [o for o in outputs if not o['disabled']]
-    active_pipelines = [p for p in pipelines if not p['disabled']]
-    enabled_routes = [r for r in routes if r['enabled']]
+    active_inputs = None if inputs is None else [i for i in inputs if not i['disabled']]
+    active_outputs = None if outputs is None else [o for o in outputs if not o['disabled']]
+    active_pipelines = None if pipelines is None else [p for p in pipelines if not p['disabled']]
+    enabled_routes = None if routes is None else [r for r in routes if r['enabled']]
+
+    def count(items: Optional[List[Dict]]) -> str:
+        return '-' if items is None else str(len(items))
 
-    # Determine unique types for display (show all)
-    input_types = sorted(set(i['type'] for i in active_inputs))
-    output_types = sorted(set(o['type'] for o in active_outputs))
-    pipeline_ids = sorted([p['id'] for p in active_pipelines])
+    # Count each component type in one pass (show all, most common first)
+    input_type_counts = Counter(i['type'] for i in active_inputs or ())
+    output_type_counts = Counter(o['type'] for o in active_outputs or ())
+    pipeline_ids = sorted(p['id'] for p in active_pipelines or ())
 
     print()
     print("    " + "=" * 62)
@@ -682,22 +1383,22 @@ def display_data_flow_diagram(group: Dict, inputs: List[Dict], outputs: List[Dic
     print("    +-----------+     +-----------+     +-----------+     +------------+")
     print("    |  SOURCES  | --> |   ROUTES  | --> | PIPELINES | --> |   OUTPUTS  |")
     print("    +-----------+     +-----------+     +-----------+     +------------+")
-    print(f"    | {len(active_inputs):^9} |     | {len(enabled_routes):^9} |     | {len(active_pipelines):^9} |     | {len(active_outputs):^10} |")
+    print(f"    | {count(active_inputs):^9} |     | {count(enabled_routes):^9} |     | {count(active_pipelines):^9} |     | {count(active_outputs):^10} |")
     print("    +-----------+     +-----------+     +-----------+     +------------+")
     print()
 
     # Show component types
-    print("    Source Types:")
-    for t in input_types:
-        print(f"      - {t}")
+    print("    Source Types:" + (" (not fetched)" if inputs is None else ""))
+    for t, n in sorted(input_type_counts.items(), key=lambda tc: (-tc[1], tc[0])):
+        print(f"      - {t} ({n})")
 
     print()
-    print("    Output Types:")
-    for t in output_types:
-        print(f"      - {t}")
+    print("    Output Types:" + (" (not fetched)" if outputs is None else ""))
+    for t, n in sorted(output_type_counts.items(), key=lambda tc: (-tc[1], tc[0])):
+        print(f"      - {t} ({n})")
 
     print()
-    print("    Active Pipelines:")
+    print("    Active Pipelines:" + (" (not fetched)" if pipelines is None else ""))
     for p in pipeline_ids:
         print(f"      - {p}")
 
@@ -705,7 +1406,8 @@ def display_data_flow_diagram(group: Dict, inputs: List[Dict], outputs: List[Dic
 
 
 def display_architecture_summary(groups: List[Dict], workers: List[Dict],
-                                 all_group_data: Dict[str, Dict]):
+                                 all_group_data: Dict[str, Dict],
+                                 kinds: Optional[List[str]] = None):
     """
     Display a high-level summary of the entire Cribl architecture.
 
@@ -713,42 +1415,45 @@ def display_architecture_summary(groups: List[Dict], workers: List[Dict],
         groups: List of all worker groups
         workers: List of all workers
         all_group_data: Dictionary mapping group IDs to their components
+        kinds: Component keys that were fetched (None means all of them);
+               totals of the others are reported as not fetched
     """
     print_header("ARCHITECTURE SUMMARY")
 
-    # Count totals
-    total_inputs = sum(len(d.get('inputs', [])) for d in all_group_data.values())
-    total_outputs = sum(len(d.get('outputs', [])) for d in all_group_data.values())
-    total_pipelines = sum(len(d.get('pipelines', [])) for d in all_group_data.values())
-    total_routes = sum(len(d.get('routes', [])) for d in all_group_data.values())
-    total_packs = sum(len(d.get('packs', [])) for d in all_group_data.values())
-
-    online_workers = len([w for w in workers if w['status'] == 'Online'])
-    stream_workers = [w for w in workers if w['type'] == 'Stream']
-    edge_workers = [w for w in workers if w['type'] == 'Edge']
-    stream_online = len([w for w in stream_workers if w['status'] == 'Online'])
-    edge_online = len([w for w in edge_workers if w['status'] == 'Online'])
-
-    # Organize workers by group
-    workers_by_group: Dict[str, List[Dict]] = {}
+    # Count component totals in a single pass over the groups
+    totals = Counter()
+    for d in all_group_data.values():
+        for key in ('inputs', 'outputs', 'pipelines', 'routes', 'packs'):
+            totals[key] += len(d.get(key, ()))
+
+    def total(key: str, width: int = 0) -> str:
+        value = str(totals[key]) if kinds is None or key in kinds else 'not fetched'
+        return f"{value:^{width}}" if width else value
+
+    # Tally workers by type and status and organize them by group in one pass
+    workers_by_type: Counter = Counter()
+    online_by_type: Counter = Counter()
+    online_by_group: Counter = Counter()
+    workers_by_group: Dict[str, List[Dict]] = defaultdict(list)
     for worker in workers:
-        group_id = worker['group']
-        if group_id not in workers_by_group:
-            workers_by_group[group_id] = []
-        workers_by_group[group_id].append(worker)
+        workers_by_type[worker['type']] += 1
+        if worker['status'] == 'Online':
+            online_by_type[worker['type']] += 1
+            online_by_group[worker['group']] += 1
+        workers_by_group[worker['group']].append(worker)
 
     print(f"""
     Cribl Cloud Environment Overview
     ================================
 
     Worker Groups (Fleets):  {len(groups)}
-    Stream Workers:          {len(stream_workers)} ({stream_online} online)
-    Edge Nodes:              {len(edge_workers)} ({edge_online} online)
-    Total Sources:           {total_inputs}
-    Total Destinations:      {total_outputs}
-    Total Pipelines:         {total_pipelines}
-    Total Routes:            {total_routes}
-    Total Packs:             {total_packs}
+    Stream Workers:          {workers_by_type['Stream']} ({online_by_type['Stream']} online)
+    Edge Nodes:              {workers_by_type['Edge']} ({online_by_type['Edge']} online)
+    Total Sources:           {total('inputs')}
+    Total Destinations:      {total('outputs')}
+    Total Pipelines:         {total('pipelines')}
+    Total Routes:            {total('routes')}
+    Total Packs:             {total('packs')}
 
     Workers by Group/Fleet:
     -----------------------""")
@@ -757,7 +1462,7 @@ def display_architecture_summary(groups: List[Dict], workers: List[Dict],
         group_id = group['id']
         group_workers = workers_by_group.get(group_id, [])
         if group_workers:
-            online = len([w for w in group_workers if w['status'] == 'Online'])
+            online = online_by_group[group_id]
             worker_type = group_workers[0]['type'] if group_workers else 'N/A'
             print(f"    {group['name']:<25} {len(group_workers):>2} {worker_type:<6} ({online} online)")
 
@@ -766,12 +1471,17 @@ def display_architecture_summary(groups: List[Dict], workers: List[Dict],
     if empty_groups:
         print(f"\n    Groups with no workers: {', '.join(g['name'] for g in empty_groups)}")
 
+    # The flow diagram only makes sense when every stage was fetched
+    if kinds is not None and not {'inputs', 'outputs', 'pipelines', 'routes'} <= set(kinds):
+        print()
+        return
+
     print(f"""
     Data Flow Overview:
 
         +-------------+    +-------------+    +-------------+    +--------------+
         |   SOURCES   | => |   ROUTES    | => |  PIPELINES  | => | DESTINATIONS |
-        | ({total_inputs:^9}) |    | ({total_routes:^9}) |    | ({total_pipelines:^9}) |    | ({total_outputs:^10}) |
+        | ({total('inputs', 9)}) |    | ({total('routes', 9)}) |    | ({total('pipelines', 9)}) |    | ({total('outputs', 10)}) |
         +-------------+    +-------------+    +-------------+    +--------------+
     """)
 
@@ -780,6 +1490,34 @@ def display_architecture_summary(groups: List[Dict], workers: List[Dict],
 # MAIN APPLICATION FUNCTIONS
 # ============================================================================
 
+def base_url_error(base_url: str) -> Optional[str]:
+    """
+    Check that a base URL is usable before any request is made.
+
+    Args:
+        base_url: The URL entered by the user
+
+    Returns:
+        A message describing what is wrong, or None if the URL is valid
+    """
+    if not base_url.lower().startswith(('http://', 'https://')):
+        return "URL must start with http:// or https://"
+
+    try:
+        parts = urlsplit(base_url)
+    except ValueError:
+        return "URL host is not valid (check the brackets around an IPv6 address)"
+    if not parts.hostname:
+        return "URL has no host name (e.g., https://main-instance.cribl.cloud)"
+    if any(ch.isspace() for ch in parts.netloc):
+        return "URL host must not contain spaces"
+    try:
+        parts.port
+    except ValueError:
+        return "URL port must be a number between 0 and 65535"
+    return None
+
+
 def get_credentials() -> Tuple[str, str]:
     """
     Securely prompt the user for Cribl Cloud credentials.
@@ -803,23 +1541,133 @@ def get_credentials() -> Tuple[str, str]:
         if not base_url:
             print("    Error: URL cannot be empty.")
             continue
-        if not base_url.startswith(('http://', 'https://')):
-            print("    Error: URL must start with http:// or https://")
+        error = base_url_error(base_url)
+        if error:
+            print(f"    Error: {error}")
             continue
         break
 
     while True:
         # Use getpass to hide the token input
+        import getpass
         token = getpass.getpass("    Enter Bearer token (hidden): ").strip()
         if not token:
             print("    Error: Token cannot be empty.")
             continue
+        if not _TOKEN_RE.match(token):
+            print("    Error: Token looks invalid (expected at least 20 letters, digits, '.', '_' or '-').")
+            continue
         break
 
     return base_url, token
 
 
-def fetch_all_data(client: CriblAPIClient) -> Tuple[bool, Dict]:
+# Per-group components: (key in GROUP_ENDPOINTS and group data, extraction function)
+# The Cribl API has no documented bulk endpoint for a group's configuration,
+# so each component is its own request; they are fetched concurrently instead.
+GROUP_COMPONENTS = (
+    ('inputs', extract_input_info),
+    ('outputs', extract_output_info),
+    ('pipelines', extract_pipeline_info),
+    ('routes', extract_route_info),
+    ('packs', extract_pack_info),
+)
+
+
+def fetch_group_component(client: CriblAPIClient, component: str, group_id: str,
+                          extract) -> Tuple[bool, Any]:
+    """
+    Fetch and extract one component of a worker group.
+
+    Args:
+        client: Configured CriblAPIClient instance
+        component: The component key in GROUP_ENDPOINTS
+        group_id: The ID of the worker group
+        extract: The extract_* function to apply to the response
+
+    Returns:
+        Tuple of (success, extracted list or error message)
+    """
+    success, response = client.get_group_component_raw(component, group_id)
+    if not success:
+        return False, response
+    version, body = response
+    return True, extract_and_cache(
+        (client.account_key, component, group_id), version, body, extract
+    )
+
+
+def collect_all_group_data(client: CriblAPIClient, groups: List[Dict],
+                           components: Optional[List[str]] = None,
+                           on_group_done: Optional[Callable[[int, int], None]] = None
+                           ) -> Tuple[Dict[str, Dict], List[Tuple[str, str, str]]]:
+    """
+    Fetch the components of every group concurrently.
+
+    Each (group, component) pair is an independent GET against the same host,
+    so they are submitted to the client's thread pool and share its session.
+    Responses are extracted on the thread that fetched them, so parsing one
+    group overlaps with the requests still in flight for the others.
+    Failed requests are not repeated here: the transport has already
+    retried temporary failures with backoff before reporting them.
+
+    Args:
+        client: Configured CriblAPIClient instance
+        groups: List of extracted group information
+        components: Component keys to fetch (None fetches all of them);
+                    components that are skipped are left empty
+        on_group_done: Optional callback receiving (groups done, total groups)
+                       each time every component of a group has arrived
+
+    Returns:
+        Tuple of (dictionary mapping group IDs to their group info and extracted
+        components, list of (group ID, component, error) for components that
+        could not be fetched and were left empty)
+    """
+    # Pre-populate in group order so results can arrive in any order
+    all_group_data = {
+        group['id']: {'group': group, **{key: [] for key, _ in GROUP_COMPONENTS}}
+        for group in groups
+    }
+    wanted = [
+        (key, extract) for key, extract in GROUP_COMPONENTS
+        if components is None or key in components
+    ]
+    if not groups or not wanted:
+        return all_group_data, []
+
+    # Map each request straight to the dict its result belongs in
+    futures = {
+        client.executor.submit(fetch_group_component, client, key, group['id'], extract):
+            (group['id'], all_group_data[group['id']], key)
+        for group in groups
+        for key, extract in wanted
+    }
+
+    pending = dict.fromkeys(all_group_data, len(wanted))
+    groups_done = 0
+    errors = []
+
+    for future in as_completed(futures):
+        group_id, group_data, key = futures[future]
+        success, extracted = future.result()
+        if success:
+            group_data[key] = extracted
+        else:
+            errors.append((group_id, key, extracted))
+
+        pending[group_id] -= 1
+        if not pending[group_id]:
+            groups_done += 1
+            if on_group_done:
+                on_group_done(groups_done, len(groups))
+
+    return all_group_data, errors
+
+
+def fetch_all_data(client: CriblAPIClient, group_ids: Optional[List[str]] = None,
+                   components: Optional[List[str]] = None, quiet: bool = False,
+                   stop: Optional[threading.Event] = None) -> Tuple[bool, Dict]:
     """
     Fetch all data from the Cribl API.
 
@@ -827,78 +1675,311 @@ def fetch_all_data(client: CriblAPIClient) -> Tuple[bool, Dict]:
 
     Args:
         client: Configured CriblAPIClient instance
+        group_ids: Only include these group IDs (None includes every group)
+        components: Per-group component keys to fetch (None fetches all of them)
+        quiet: Suppress progress output (used by background refreshes)
+        stop: Optional event that cancels the fetch before the per-group
+              requests are sent
 
     Returns:
-        Tuple of (success, data dictionary or error message)
+        Tuple of (success, data dictionary or error message); the data's
+        '_incomplete' flag is set when some components could not be fetched
     """
-    print("\n    Fetching data from Cribl API...")
-
-    # Fetch groups
-    print("    - Fetching worker groups...", end=" ")
-    success, groups_data = client.get_groups()
+    out = io.StringIO() if quiet else sys.stdout
+    print("\n    Fetching data from Cribl API...", file=out)
+
+    # Fetch groups and workers concurrently (they are independent)
+    print("    - Fetching worker groups and workers...", end=" ", file=out)
+    groups_future = client.executor.submit(client.get_groups)
+    workers_future = client.executor.submit(client.get_workers)
+    success, groups_data = groups_future.result()
+    workers_success, workers_data = workers_future.result()
     if not success:
-        print("FAILED")
-        return False, f"Failed to fetch groups: {groups_data}"
-    print("OK")
+        print("FAILED", file=out)
+        return False, groups_data.with_context("Failed to fetch groups: ")
+    if not workers_success:
+        print("FAILED", file=out)
+        return False, workers_data.with_context("Failed to fetch workers: ")
+    print("OK", file=out)
+
+    if stop is not None and stop.is_set():
+        return False, APIError("Fetch cancelled.")
 
     groups = extract_group_info(groups_data)
 
-    # Fetch workers
-    print("    - Fetching workers...", end=" ")
-    success, workers_data = client.get_workers()
-    if not success:
-        print("FAILED")
-        return False, f"Failed to fetch workers: {workers_data}"
-    print("OK")
+    # Narrow down to the requested groups before any per-group work
+    if group_ids is not None:
+        unknown = set(group_ids).difference(g['id'] for g in groups)
+        if unknown:
+            print(f"    Warning: unknown group ID(s): {', '.join(sorted(unknown))}", file=out)
+        groups = [g for g in groups if g['id'] in group_ids]
 
     workers = extract_worker_info(workers_data)
+    if group_ids is not None:
+        workers = [w for w in workers if w['group'] in group_ids]
 
     # Update worker counts in groups based on actual fetched workers
     # The API's workerCount field may not be accurate, so we calculate from real data
-    workers_by_group: Dict[str, int] = {}
-    for worker in workers:
-        group_id = worker['group']
-        workers_by_group[group_id] = workers_by_group.get(group_id, 0) + 1
+    workers_by_group = Counter(worker['group'] for worker in workers)
 
     for group in groups:
         group['worker_count'] = workers_by_group.get(group['id'], 0)
 
-    # Fetch details for each group
-    all_group_data = {}
-    for group in groups:
-        group_id = group['id']
-        print(f"    - Fetching details for group '{group['name']}'...", end=" ")
+    # Fetch details for all groups concurrently, updating one progress line
+    if components is None or components:
+        label = f"    - Fetching details for {len(groups)} groups..."
+        out.write(label)
+        out.flush()
+
+        def show_progress(done: int, total: int):
+            if out.isatty():
+                out.write(f"\r{label} [{done}/{total}]")
+                out.flush()
+
+        all_group_data, errors = collect_all_group_data(client, groups, components, show_progress)
+        # Pad over the longer "[done/total]" text when overwriting it
+        padding = ' ' * (2 * len(str(len(groups))) + 1)
+        out.write(f"\r{label} OK{padding}\n" if out.isatty() else " OK\n")
+
+        # Components a group does not have (e.g. 404) are expected to be empty;
+        # only mention the ones that were lost to network or server trouble
+        unavailable = [(group_id, key, error) for group_id, key, error in errors if error.transient]
+        if unavailable:
+            group_id, key, error = unavailable[0]
+            group_name = all_group_data[group_id]['group']['name']
+            print(f"    Warning: {len(unavailable)} component(s) could not be fetched and are shown empty "
+                  f"(e.g. {key} of '{group_name}': {error})", file=out)
+    else:
+        all_group_data, _ = collect_all_group_data(client, groups, components)
+        unavailable = []
+
+    return True, {
+        'groups': groups,
+        'workers': workers,
+        'group_data': all_group_data,
+        '_group_menu': format_group_menu(groups),
+        # Components that were fetched; the others are left empty without being looked at
+        '_kinds': [key for key, _ in GROUP_COMPONENTS if components is None or key in components],
+        # Partial results are shown, but never saved or reused as a refresh
+        '_incomplete': bool(unavailable),
+    }
 
-        group_data = {'group': group}
 
-        # Fetch inputs
-        success, inputs_data = client.get_inputs(group_id)
-        group_data['inputs'] = extract_input_info(inputs_data) if success else []
+def snapshot_key(client: CriblAPIClient, fetch_options: Dict) -> str:
+    """
+    Build the data snapshot key for an account and set of fetch options.
 
-        # Fetch outputs
-        success, outputs_data = client.get_outputs(group_id)
-        group_data['outputs'] = extract_output_info(outputs_data) if success else []
+    The key includes the client's account key, so different accounts on the
+    same instance do not share snapshots.
 
-        # Fetch pipelines
-        success, pipelines_data = client.get_pipelines(group_id)
-        group_data['pipelines'] = extract_pipeline_info(pipelines_data) if success else []
+    Args:
+        client: Configured CriblAPIClient instance
+        fetch_options: Keyword arguments passed to fetch_all_data
 
-        # Fetch routes
-        success, routes_data = client.get_routes(group_id)
-        group_data['routes'] = extract_route_info(routes_data) if success else []
+    Returns:
+        Hex digest identifying the snapshot
+    """
+    material = '\n'.join([
+        client.account_key,
+        json.dumps(fetch_options, sort_keys=True),
+    ])
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
 
-        # Fetch packs
-        success, packs_data = client.get_packs(group_id)
-        group_data['packs'] = extract_pack_info(packs_data) if success else []
 
-        all_group_data[group_id] = group_data
-        print("OK")
+def load_or_fetch_data(client: CriblAPIClient, fetch_options: Dict,
+                       refresh: bool = False, quiet: bool = False,
+                       stop: Optional[threading.Event] = None) -> Tuple[bool, Dict]:
+    """
+    Load recently fetched data from disk, or fetch it from the API.
 
-    return True, {
-        'groups': groups,
-        'workers': workers,
-        'group_data': all_group_data
-    }
+    Complete, successful fetches are saved as a snapshot so a relaunch within
+    DATA_SNAPSHOT_TTL seconds does not need any API calls. Fetches where some
+    components could not be retrieved are not saved, so the next run tries
+    them again (and warns again if they still fail). A refresh bypasses the
+    saved snapshot but leaves it in place until a complete fetch replaces it,
+    so a cancelled, failed or incomplete refresh does not lose it.
+
+    Args:
+        client: Configured CriblAPIClient instance
+        fetch_options: Keyword arguments passed to fetch_all_data
+        refresh: Ignore any saved snapshot and fetch fresh data
+        quiet: Suppress progress output (used by background refreshes)
+        stop: Optional event that cancels the fetch (see fetch_all_data)
+
+    Returns:
+        Tuple of (success, data dictionary or error message)
+    """
+    if client.cache is None:
+        return fetch_all_data(client, quiet=quiet, stop=stop, **fetch_options)
+
+    key = snapshot_key(client, fetch_options)
+    if not refresh:
+        snapshot = client.cache.load_snapshot(key, DATA_SNAPSHOT_TTL)
+        if snapshot is not None:
+            age, data = snapshot
+            if not quiet:
+                print(f"\n    Using data fetched {int(age)}s ago (select 'Refresh Data' to update).")
+            return True, data
+
+    success, data = fetch_all_data(client, quiet=quiet, stop=stop, **fetch_options)
+    if success and not data['_incomplete']:
+        client.cache.store_snapshot(key, data)
+    return success, data
+
+
+class BackgroundRefresh:
+    """
+    Quietly refetch all data on a daemon thread while the user reads the menu.
+
+    After PREFETCH_DELAY seconds the data is fetched again (bypassing the
+    in-memory response cache) and held until "Refresh Data" picks it up, so
+    a refresh is usually instant. Nothing is printed from the thread; a
+    failed or incomplete background fetch is simply discarded.
+    """
+
+    def __init__(self, client: CriblAPIClient, fetch_options: Dict,
+                 delay: float = PREFETCH_DELAY):
+        """
+        Start the background refresh.
+
+        Args:
+            client: Configured CriblAPIClient instance
+            fetch_options: Keyword arguments passed to fetch_all_data
+            delay: Seconds to wait before fetching
+        """
+        self._client = client
+        self._fetch_options = fetch_options
+        self._delay = delay
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._result: Optional[Tuple[float, Dict]] = None
+        threading.Thread(target=self._run, name='cribl-prefetch', daemon=True).start()
+
+    def _run(self):
+        if self._stop.wait(self._delay):
+            return
+        try:
+            self._client.invalidate()
+            success, data = load_or_fetch_data(
+                self._client, self._fetch_options, refresh=True, quiet=True, stop=self._stop
+            )
+        except Exception:
+            return  # e.g. the client was closed while fetching
+        # Keep only complete data; otherwise "Refresh Data" fetches again in
+        # the foreground, where missing components are reported
+        if success and not data['_incomplete'] and not self._stop.is_set():
+            with self._lock:
+                self._result = (time.monotonic(), data)
+
+    def take(self, max_age: float = PREFETCH_MAX_AGE) -> Optional[Dict]:
+        """
+        Return the prefetched data if it is ready and recent enough.
+
+        Args:
+            max_age: Maximum age in seconds of usable prefetched data
+
+        Returns:
+            Fetched data dictionary, or None if there is nothing usable
+        """
+        with self._lock:
+            result, self._result = self._result, None
+        if result is None or time.monotonic() - result[0] > max_age:
+            return None
+        return result[1]
+
+    def stop(self):
+        """
+        Stop the refresh.
+
+        A fetch in flight is cancelled before its per-group requests are sent,
+        and any result it still produces is discarded.
+        """
+        self._stop.set()
+
+
+def read_input(prompt: str, on_eof: str = 'Q') -> str:
+    """
+    Read a line of user input, treating a closed stdin as a final answer.
+
+    When input is piped in (scripts, test harnesses) and runs out, input()
+    raises EOFError on every call; returning on_eof instead (quit, by default)
+    lets the explorer exit cleanly rather than erroring.
+
+    Args:
+        prompt: Prompt to display
+        on_eof: Value returned once stdin is closed
+
+    Returns:
+        The line entered by the user, or on_eof at end of input
+    """
+    try:
+        return input(prompt)
+    except EOFError:
+        print()
+        return on_eof
+
+
+def format_group_menu(groups: List[Dict]) -> str:
+    """Format the numbered list of groups offered by the group selection prompt."""
+    return '\n'.join(
+        f"      {i}. {group['name']} ({group['id']})"
+        for i, group in enumerate(groups, 1)
+    )
+
+
+def prompt_group_selection(data: Dict) -> Optional[Dict]:
+    """
+    Ask the user to pick a worker group by number.
+
+    Args:
+        data: Fetched data dictionary
+
+    Returns:
+        The selected group, or None if there are no groups or the input is invalid
+    """
+    if not data['groups']:
+        print("\n    No worker groups available.")
+        return None
+
+    print("\n    Available groups:")
+    print(data.get('_group_menu') or format_group_menu(data['groups']))
+
+    try:
+        idx = int(read_input("    Select group number: ", on_eof='').strip()) - 1
+    except ValueError:
+        print("    Please enter a valid number.")
+        return None
+
+    if 0 <= idx < len(data['groups']):
+        return data['groups'][idx]
+    print("    Invalid selection.")
+    return None
+
+
+def show_group_view(data: Dict, display_fn: Callable, components: Tuple[str, ...]):
+    """
+    Ask for a worker group and show one view of it.
+
+    Args:
+        data: Fetched data dictionary
+        display_fn: Display function taking the group followed by one list
+                    (or None if it was not fetched) per component
+        components: Component keys passed to display_fn, in order
+    """
+    # Components skipped with --kinds/--summary-only are passed as None
+    kinds = data.get('_kinds')
+    if kinds is not None and not set(components) & set(kinds):
+        print("\n    Group components were not fetched (run without --summary-only,")
+        print("    or include them in --kinds).")
+        return
+
+    group = prompt_group_selection(data)
+    if group:
+        group_data = data['group_data'].get(group['id'], {})
+        display_fn(group, *(
+            group_data.get(key, []) if kinds is None or key in kinds else None
+            for key in components
+        ))
 
 
 def display_menu() -> str:
@@ -921,16 +2002,107 @@ def display_menu() -> str:
     print("    Q. Quit")
     print("-" * 50)
 
-    return input("    Select option: ").strip().upper()
+    return read_input("    Select option: ").strip().upper()
+
+
+# Menu handlers: each takes (client, data, state) and returns 'QUIT' or
+# 'CHANGE_CREDENTIALS' to leave the explorer, or None to show the menu again.
+# state holds the fetch options and the current BackgroundRefresh.
+
+def _menu_summary(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Show the architecture summary (option 1)."""
+    display_architecture_summary(data['groups'], data['workers'], data['group_data'],
+                                 data.get('_kinds'))
+    return None
+
+
+def _menu_groups(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Show the worker groups (option 2)."""
+    display_groups(data['groups'])
+    return None
+
+
+def _menu_workers(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Show the workers (option 3)."""
+    display_workers(data['workers'], data['groups'])
+    return None
 
 
-def run_explorer(client: CriblAPIClient, data: Dict):
+def _menu_group_details(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Show the details of a selected group (option 4)."""
+    show_group_view(data, display_group_details,
+                    ('inputs', 'outputs', 'pipelines', 'routes', 'packs'))
+    return None
+
+
+def _menu_data_flow(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Show the data flow diagram of a selected group (option 5)."""
+    show_group_view(data, display_data_flow_diagram,
+                    ('inputs', 'outputs', 'pipelines', 'routes'))
+    return None
+
+
+def _menu_refresh(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Refresh the data, preferring the background refresh result (option 6)."""
+    print("\n    Refreshing data...")
+    prefetch = state['prefetch']
+    prefetch.stop()
+    new_data = prefetch.take()
+    if new_data is not None:
+        success = True
+    else:
+        client.invalidate()
+        success, new_data = load_or_fetch_data(client, state['fetch_options'], refresh=True)
+    if success:
+        data.update(new_data)
+        print("    Data refreshed successfully!")
+    else:
+        print(f"    Error: {new_data}")
+    state['prefetch'] = BackgroundRefresh(client, state['fetch_options'])
+    return None
+
+
+def _menu_change_credentials(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Leave the explorer so main() asks for new credentials (option 7)."""
+    return 'CHANGE_CREDENTIALS'
+
+
+def _menu_quit(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Leave the explorer and exit."""
+    print("\n    Goodbye!")
+    return 'QUIT'
+
+
+def _menu_invalid(client: CriblAPIClient, data: Dict, state: Dict) -> Optional[str]:
+    """Report an unrecognised menu choice."""
+    print("    Invalid option. Please try again.")
+    return None
+
+
+_MENU_HANDLERS: Dict[str, Callable[[CriblAPIClient, Dict, Dict], Optional[str]]] = {
+    '1': _menu_summary,
+    '2': _menu_groups,
+    '3': _menu_workers,
+    '4': _menu_group_details,
+    '5': _menu_data_flow,
+    '6': _menu_refresh,
+    '7': _menu_change_credentials,
+    'Q': _menu_quit,
+    '': lambda client, data, state: None,  # Only show an error if something was entered
+}
+
+
+def run_explorer(client: CriblAPIClient, data: Dict, fetch_options: Optional[Dict] = None):
     """
     Run the main explorer interface loop.
 
     Args:
         client: Configured CriblAPIClient instance
         data: Fetched data dictionary
+        fetch_options: Keyword arguments passed to fetch_all_data on refresh
+
+    Returns:
+        'QUIT' or 'CHANGE_CREDENTIALS'
     """
     # Flush any buffered input from password entry
     try:
@@ -939,146 +2111,161 @@ def run_explorer(client: CriblAPIClient, data: Dict):
     except (ImportError, termios.error):
         pass  # Not available on Windows or if stdin is not a terminal
 
+    fetch_options = fetch_options or {}
+    state = {
+        'fetch_options': fetch_options,
+        'prefetch': BackgroundRefresh(client, fetch_options),
+    }
+
     while True:
         choice = display_menu()
 
-        if choice == '1':
-            # Architecture Summary
-            display_architecture_summary(
-                data['groups'],
-                data['workers'],
-                data['group_data']
-            )
-
-        elif choice == '2':
-            # Worker Groups
-            display_groups(data['groups'])
-
-        elif choice == '3':
-            # Workers
-            display_workers(data['workers'], data['groups'])
-
-        elif choice == '4':
-            # Group Details
-            if not data['groups']:
-                print("\n    No worker groups available.")
-                continue
-
-            print("\n    Available groups:")
-            for i, group in enumerate(data['groups'], 1):
-                print(f"      {i}. {group['name']} ({group['id']})")
-
-            try:
-                selection = input("    Select group number: ").strip()
-                idx = int(selection) - 1
-                if 0 <= idx < len(data['groups']):
-                    group = data['groups'][idx]
-                    group_data = data['group_data'].get(group['id'], {})
-                    display_group_details(
-                        group,
-                        group_data.get('inputs', []),
-                        group_data.get('outputs', []),
-                        group_data.get('pipelines', []),
-                        group_data.get('routes', []),
-                        group_data.get('packs', [])
-                    )
-                else:
-                    print("    Invalid selection.")
-            except ValueError:
-                print("    Please enter a valid number.")
-
-        elif choice == '5':
-            # Data Flow Diagram
-            if not data['groups']:
-                print("\n    No worker groups available.")
-                continue
-
-            print("\n    Available groups:")
-            for i, group in enumerate(data['groups'], 1):
-                print(f"      {i}. {group['name']} ({group['id']})")
-
-            try:
-                selection = input("    Select group number: ").strip()
-                idx = int(selection) - 1
-                if 0 <= idx < len(data['groups']):
-                    group = data['groups'][idx]
-                    group_data = data['group_data'].get(group['id'], {})
-                    display_data_flow_diagram(
-                        group,
-                        group_data.get('inputs', []),
-                        group_data.get('outputs', []),
-                        group_data.get('pipelines', []),
-                        group_data.get('routes', [])
-                    )
-                else:
-                    print("    Invalid selection.")
-            except ValueError:
-                print("    Please enter a valid number.")
-
-        elif choice == '6':
-            # Refresh Data
-            print("\n    Refreshing data...")
-            success, new_data = fetch_all_data(client)
-            if success:
-                data.update(new_data)
-                print("    Data refreshed successfully!")
-            else:
-                print(f"    Error: {new_data}")
+        # An unexpected error in one view should not throw away the fetched data
+        try:
+            result = _MENU_HANDLERS.get(choice, _menu_invalid)(client, data, state)
+        except Exception as e:
+            print(f"\n    Unexpected error: {str(e)}")
+            print("    Your data is unchanged; please try another option.")
+            continue
 
-        elif choice == '7':
-            # Change Credentials - signal to restart
-            return 'CHANGE_CREDENTIALS'
+        if result:
+            state['prefetch'].stop()
+            return result
 
-        elif choice == 'Q':
-            print("\n    Goodbye!")
-            return 'QUIT'
 
-        elif choice:  # Only show error if user actually entered something
-            print("    Invalid option. Please try again.")
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line options.
 
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
 
-def main():
+    Returns:
+        Parsed options namespace
+    """
+    def comma_list(value: str) -> List[str]:
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    def positive_int(value: str) -> int:
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError("must be at least 1")
+        return number
+
+    parser = argparse.ArgumentParser(
+        description="Explore the architecture of a Cribl Cloud environment."
+    )
+    parser.add_argument(
+        '--groups', type=comma_list, metavar='ID1,ID2',
+        help="only explore these worker group IDs"
+    )
+    parser.add_argument(
+        '--kinds', type=comma_list, metavar='KIND1,KIND2',
+        help="only fetch these per-group components "
+             f"({', '.join(key for key, _ in GROUP_COMPONENTS)})"
+    )
+    parser.add_argument(
+        '--summary-only', action='store_true',
+        help="only fetch groups and workers, skipping per-group components"
+    )
+    parser.add_argument(
+        '--max-workers', type=positive_int, default=MAX_WORKERS, metavar='N',
+        help=f"maximum number of concurrent API requests (default: {MAX_WORKERS})"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="do not read or write the on-disk response cache"
+    )
+    parser.add_argument(
+        '--http2', action='store_true',
+        help="multiplex requests over one HTTP/2 connection (requires httpx[http2])"
+    )
+    args = parser.parse_args(argv)
+
+    if args.kinds is not None:
+        invalid = set(args.kinds).difference(key for key, _ in GROUP_COMPONENTS)
+        if invalid:
+            parser.error(f"unknown kind(s): {', '.join(sorted(invalid))}")
+    if args.summary_only:
+        args.kinds = []
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main entry point for the Cribl Architecture Explorer.
 
     Handles the credential input, data fetching, and main application loop.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     """
+    args = parse_args(argv)
+    fetch_options = {'group_ids': args.groups, 'components': args.kinds}
+
+    # Fail fast on a missing dependency without paying for the import itself
+    if importlib.util.find_spec('requests') is None:
+        _require('requests')
+    if args.http2:
+        for module_name in ('httpx', 'h2'):
+            if importlib.util.find_spec(module_name) is None:
+                _require(module_name, 'httpx[http2]')
+
     while True:
         try:
             # Get credentials from user
             base_url, token = get_credentials()
 
-            # Create API client
-            client = CriblAPIClient(base_url, token)
-
-            # Fetch initial data
-            success, data = fetch_all_data(client)
-
-            if not success:
-                print(f"\n    Error: {data}")
-                print("    Please check your credentials and try again.")
-                retry = input("\n    Press Enter to retry or 'Q' to quit: ").strip().upper()
-                if retry == 'Q':
+            # Create API client (closed when leaving the block)
+            cache_dir = None if args.no_cache else CACHE_DIR
+            with CriblAPIClient(base_url, token, cache_dir=cache_dir,
+                                max_workers=args.max_workers, http2=args.http2) as client:
+                # Fetch initial data, retrying temporary failures with the
+                # same credentials instead of asking for them again
+                success, data = load_or_fetch_data(client, fetch_options)
+                retry = ''
+                while not success and data.transient:
+                    print(f"\n    Error: {data}")
+                    retry = read_input(
+                        "\n    Press Enter to retry, 'C' to change credentials or 'Q' to quit: "
+                    ).strip().upper()
+                    if retry in ('C', 'Q'):
+                        break
+                    success, data = load_or_fetch_data(client, fetch_options)
+
+                if not success:
+                    if retry == 'Q':
+                        break
+                    if retry != 'C':
+                        print(f"\n    Error: {data}")
+                        print("    Please check your credentials and try again.")
+                        retry = read_input("\n    Press Enter to retry or 'Q' to quit: ").strip().upper()
+                        if retry == 'Q':
+                            break
+                    continue
+
+                print("\n    Data fetched successfully!")
+
+                # Run the explorer interface
+                result = run_explorer(client, data, fetch_options)
+
+                if result == 'QUIT':
                     break
-                continue
-
-            print("\n    Data fetched successfully!")
-
-            # Run the explorer interface
-            result = run_explorer(client, data)
-
-            if result == 'QUIT':
-                break
-            elif result == 'CHANGE_CREDENTIALS':
-                continue
+                elif result == 'CHANGE_CREDENTIALS':
+                    continue
 
         except KeyboardInterrupt:
             print("\n\n    Interrupted. Goodbye!")
             break
+        except EOFError:
+            # Input closed while entering credentials
+            print("\n\n    No more input. Goodbye!")
+            break
         except Exception as e:
             print(f"\n    Unexpected error: {str(e)}")
             print("    Please try again or check your inputs.")
-            retry = input("\n    Press Enter to retry or 'Q' to quit: ").strip().upper()
+            retry = read_input("\n    Press Enter to retry or 'Q' to quit: ").strip().upper()
             if retry == 'Q':
                 break
 